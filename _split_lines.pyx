@@ -0,0 +1,35 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C kernel for BufferedLineReader.
+Build in place with: cythonize -i _split_lines.pyx
+"""
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.string cimport memchr
+
+
+def split_lines(const unsigned char[::1] buf, Py_ssize_t end, decode):
+    """
+    Same result as list(map(decode, buf[:end].split(b'\\n'))), but scans with memchr and
+    hands each line straight to decode, without building the intermediate list of bytes.
+    decode is the reader's bound callable, so the codec is not looked up again per line.
+    """
+    cdef list lines = []
+    cdef const char *p
+    cdef const char *stop
+    cdef const char *nl
+
+    if end > buf.shape[0]:
+        end = buf.shape[0]
+    if end <= 0:
+        lines.append(decode(b""))
+        return lines
+
+    p = <const char *> &buf[0]
+    stop = p + end
+    while True:
+        nl = <const char *> memchr(p, c'\n', stop - p)
+        if nl == NULL:
+            lines.append(decode(PyBytes_FromStringAndSize(p, stop - p)))
+            return lines
+        lines.append(decode(PyBytes_FromStringAndSize(p, nl - p)))
+        p = nl + 1
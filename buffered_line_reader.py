@@ -1,4 +1,5 @@
 import cProfile
+import codecs
 import pstats
 import io
 import functools
@@ -7,12 +8,69 @@ import os
 import gzip
 import bz2
 import lzma
+import mmap
+import multiprocessing
+import stat
+import struct
+import sys
 import threading
-from queue import Queue
-from typing import Union, IO, Optional, Generator, Iterable
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, IO, Optional, Callable, Generator, Iterable, Tuple
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    from isal import igzip
+except ImportError:
+    igzip = None
+
+try:
+    import _split_lines
+except ImportError:
+    _split_lines = None
+
+# Stateless single-byte charmap codecs that decode every ASCII byte to itself.
+_ASCII_CHARMAP_CODECS = frozenset({
+    'cp1250', 'cp1251', 'cp1253', 'cp1254', 'cp1255', 'cp1256', 'cp1257', 'cp1258',
+    'cp437', 'cp850', 'cp866', 'koi8-r', 'koi8-u', 'mac-roman',
+    'iso8859-2', 'iso8859-5', 'iso8859-7', 'iso8859-9', 'iso8859-15',
+})
+
+# Stateless codecs where byte 0x0A only ever decodes to '\n' on its own (and the standard error
+# handlers never swallow it): decoding a run of whole lines and splitting the text gives the
+# same lines as decoding them one by one, in two C passes instead of a Python loop per line.
+# Multi-byte CJK codecs are left out: gb18030 and euc_jp can swallow b'\n' into a bad sequence.
+_SPLIT_AFTER_DECODE_CODECS = frozenset({'utf-8', 'ascii', 'iso8859-1', 'cp1252'}) | _ASCII_CHARMAP_CODECS
+_SPLIT_AFTER_DECODE_ERRORS = frozenset({'strict', 'replace', 'ignore', 'surrogateescape', 'backslashreplace'})
+
+# Stateless codecs that decode every ASCII byte to the same character. A pure-ASCII run in one
+# of these can be decoded as ASCII in a single call. (7-bit stateful codecs such as ISO-2022 or
+# UTF-7 are deliberately absent: their ASCII bytes are not ASCII text.)
+_ASCII_SUPERSET_CODECS = frozenset({
+    'gbk', 'gb2312', 'gb18030', 'big5', 'big5hkscs', 'cp932', 'cp949', 'cp950',
+    'euc_jp', 'euc_kr', 'shift_jis',
+}) | _ASCII_CHARMAP_CODECS
+
+# BOM-less UTF-16/32: bytes.decode falls back to native byte order, but the incremental
+# decoders raise whatever errors= says, so the first code unit decides which decoder to use.
+_BOM_CODECS = {
+    'utf-16': (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE),
+    'utf-32': (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE),
+}
+
+# Call tracing is decided once at import so undecorated speed is the default.
+_DEBUG_CALLS = bool(os.environ.get('BLR_DEBUG'))
 
 
 def debug_method(method):
+    if not _DEBUG_CALLS:
+        return method
+
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs):
         if getattr(self, 'debug', False):
@@ -27,11 +85,55 @@ def debug_method(method):
     return wrapper
 
 
+def _make_decoder(encoding: str, errors: str) -> Callable[[bytes], str]:
+    codec = codecs.lookup(encoding)
+    name = codec.name
+    if name == 'utf-8' and errors == 'strict':
+        return bytes.decode
+    if name in ('utf-8', 'iso8859-1', 'ascii'):
+        # bytes.decode recognises these names without going through the codec registry.
+        def decode(data: bytes) -> str:
+            return data.decode(name, errors)
+        return decode
+    # Anything else would be looked up again on every bytes.decode call; bind the codec once.
+    codec_decode = codec.decode
+
+    def decode(data: bytes) -> str:
+        return codec_decode(data, errors)[0]
+    return decode
+
+
+def _decompress_to_connection(opener: Callable, path: str, chunk_size: int, conn) -> None:
+    # Child-process side of use_subprocess: stream decompressed chunks, then an empty message
+    # followed by the outcome (None, or the exception that stopped it).
+    status = None
+    try:
+        with opener(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                conn.send_bytes(chunk)
+    except Exception as e:
+        status = e
+    try:
+        conn.send_bytes(b"")
+        try:
+            conn.send(status)
+        except Exception:
+            conn.send(RuntimeError(repr(status)))
+    except OSError:
+        pass  # The reader went away early.
+    finally:
+        conn.close()
+
+
 class BufferedLineReader:
     """
     High-performance line reader for large text files (txt/gz/bz2/xz/lzma).
     - Safely handles chunk boundaries for any encoding (UTF-8/Unicode, etc.).
-    - Uses background thread to buffer chunks for normal files; supports compressed files.
+    - Reads local files through io_uring (when liburing is installed) or mmap; streams and
+      special files are buffered by a background thread. Supports compressed files.
     - Iterator interface: for line in BufferedLineReader(...).
     """
 
@@ -55,12 +157,18 @@ class BufferedLineReader:
         chunk_size: Optional[int] = None,
         encoding: str = 'utf-8',
         errors: str = 'replace',
-        debug: bool = False
+        debug: bool = False,
+        as_bytes: bool = False,
+        read_size: Optional[int] = None,
+        use_subprocess: bool = False
     ) -> None:
         self.user_chunk_size = chunk_size
+        self.read_size = read_size
+        self.use_subprocess = use_subprocess
         self.encoding = encoding
         self.errors = errors
         self.debug = debug
+        self.as_bytes = as_bytes
         self.closed = False
 
         self._line_count = 0
@@ -68,6 +176,8 @@ class BufferedLineReader:
         self._start_time = None
         self._total_time = 0.0
         self._mode = None
+        self._fd: Optional[int] = None
+        self._chunk_iterator: Optional[Generator[bytes, None, None]] = None
 
         self._initialize_file_properties(file_or_path)
         self._compression_type = self._detect_compression_type()
@@ -85,6 +195,7 @@ class BufferedLineReader:
     def _detect_compression_type(self) -> str:
         compression_map = {
             '.gz': self.COMPRESSION_GZIP,
+            '.bgz': self.COMPRESSION_GZIP,
             '.bz2': self.COMPRESSION_BZIP2,
             '.xz': self.COMPRESSION_XZ,
             '.lzma': self.COMPRESSION_LZMA,
@@ -109,29 +220,44 @@ class BufferedLineReader:
             return self.user_chunk_size
         return self.DEFAULT_CHUNK_SIZES.get(self._compression_type, 16 * 1024 * 1024)
 
-    def _track_line(self, line: str) -> None:
-        self._line_count += 1
-
     @debug_method
-    def __iter__(self) -> Generator[str, None, None]:
+    def __iter__(self) -> Generator[Union[str, bytes], None, None]:
         self._start_time = time.time()
-        _ = self._get_file_size()
+        file_size = self._get_file_size()
         chunk_size = self._get_chunk_size()
 
         if self._compression_type != self.COMPRESSION_NONE:
             mode = "compressed"
-            chunk_iterator: Iterable[bytes] = self._compressed_chunk_iterator(chunk_size)
+            chunk_iterator: Generator[bytes, None, None] = self._compressed_chunk_iterator(chunk_size)
+        elif liburing is not None and self.file_obj is None:
+            mode = "uring"
+            chunk_iterator = self._uring_chunk_iterator(chunk_size)
+        elif os.name == 'posix' and self.file_obj is None and file_size > 0:
+            mode = "mmap"
+            chunk_iterator = self._mmap_chunk_iterator(chunk_size)
         else:
             mode = "buffered"
             chunk_iterator = self._buffered_chunk_iterator(chunk_size)
 
         self._mode = mode
+        self._chunk_iterator = chunk_iterator
+
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+        self._decode = _make_decoder(self.encoding, self.errors)
+        # Byte-level splitting needs b'\n' to be the newline on its own (UTF-8, Latin-1, ...);
+        # wider encodings (UTF-16/32, BOM-prefixed ones) are decoded incrementally first.
+        if self.as_bytes:
+            line_iterator: Iterable[Union[str, bytes]] = self._read_lines_from_chunks_bytes(chunk_iterator)
+        elif '\n'.encode(self.encoding) == b'\n':
+            line_iterator = self._read_lines_from_chunks(chunk_iterator)
+        else:
+            line_iterator = self._read_lines_from_decoded_chunks(chunk_iterator)
 
         if self.debug:
             pr = cProfile.Profile()
             pr.enable()
             try:
-                yield from self._read_lines_from_chunks(chunk_iterator)
+                yield from line_iterator
             finally:
                 pr.disable()
                 s = io.StringIO()
@@ -143,14 +269,14 @@ class BufferedLineReader:
                 self.close()
         else:
             try:
-                yield from self._read_lines_from_chunks(chunk_iterator)
+                yield from line_iterator
             finally:
                 self._total_time = time.time() - self._start_time
                 self.close()
 
-    def _compressed_chunk_iterator(self, chunk_size: int) -> Generator[bytes, None, None]:
+    def _compressed_chunk_iterator(self, chunk_size: int) -> Generator[Union[bytes, memoryview], None, None]:
         opener = {
-            self.COMPRESSION_GZIP: gzip.open,
+            self.COMPRESSION_GZIP: igzip.open if igzip is not None else gzip.open,
             self.COMPRESSION_BZIP2: bz2.open,
             self.COMPRESSION_XZ: lzma.open,
             self.COMPRESSION_LZMA: lzma.open,
@@ -159,66 +285,515 @@ class BufferedLineReader:
             raise ValueError(f"Unsupported compression type: {self._compression_type}")
         if not isinstance(self.file_path, str):
             raise ValueError("Compressed reading requires a file path string.")
+        if self._compression_type == self.COMPRESSION_GZIP:
+            with open(self.file_path, 'rb') as raw:
+                if self._is_bgzf(raw):
+                    yield from self._bgzf_chunk_iterator(raw, chunk_size)
+                    return
+        if self.use_subprocess and self._compression_type != self.COMPRESSION_GZIP:
+            yield from self._subprocess_chunk_iterator(opener, chunk_size)
+            return
         with opener(self.file_path, 'rb') as f:
+            # Decompression releases the GIL, so it overlaps with line splitting in the consumer.
+            yield from self._prefetch_chunk_iterator(f.readinto, chunk_size, wait_for_reader=True)
+
+    def _subprocess_chunk_iterator(self, opener: Callable, chunk_size: int) -> Generator[memoryview, None, None]:
+        # bz2/lzma keep a share of each read() under the GIL; a child process decompresses the
+        # next chunk on another core while this one is split. Received into one recycled buffer.
+        ctx = multiprocessing.get_context()
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(
+            target=_decompress_to_connection,
+            args=(opener, self.file_path, chunk_size, send_conn),
+            daemon=True,
+        )
+        proc.start()
+        send_conn.close()
+        buf = bytearray(chunk_size)
+        try:
             while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
+                try:
+                    n = recv_conn.recv_bytes_into(buf)
+                except EOFError:
+                    raise EOFError("Decompressor process exited unexpectedly") from None
+                if not n:
+                    status = recv_conn.recv()
+                    if status is not None:
+                        raise status
                     break
-                yield chunk
+                with memoryview(buf) as view:
+                    yield view[:n]
+        finally:
+            recv_conn.close()
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+
+    @staticmethod
+    def _is_bgzf(file_obj: IO[bytes]) -> bool:
+        header = file_obj.read(18)
+        file_obj.seek(0)
+        # gzip magic + deflate + FEXTRA, with a 2-byte 'BC' subfield carrying the block size.
+        return (
+            len(header) == 18
+            and header[:4] == b'\x1f\x8b\x08\x04'
+            and header[12:16] == b'BC\x02\x00'
+        )
+
+    @staticmethod
+    def _read_bgzf_block(file_obj: IO[bytes]) -> Optional[tuple]:
+        truncated = "Compressed file ended before the end-of-stream marker was reached"
+        header = file_obj.read(12)
+        if not header:
+            return None
+        if len(header) < 12:
+            raise EOFError(truncated)
+        if header[:4] != b'\x1f\x8b\x08\x04':
+            raise gzip.BadGzipFile("Not a BGZF block")
+        xlen = struct.unpack_from('<H', header, 10)[0]
+        extra = file_obj.read(xlen)
+        if len(extra) < xlen:
+            raise EOFError(truncated)
+        bsize = None
+        pos = 0
+        while pos + 4 <= len(extra):
+            slen = struct.unpack_from('<H', extra, pos + 2)[0]
+            if extra[pos:pos + 2] == b'BC' and slen == 2:
+                bsize = struct.unpack_from('<H', extra, pos + 4)[0]
+            pos += 4 + slen
+        if bsize is None:
+            raise gzip.BadGzipFile("BGZF block without a BC subfield")
+        remaining = bsize + 1 - 12 - xlen
+        body = file_obj.read(remaining)
+        if len(body) < remaining or remaining < 8:
+            raise EOFError(truncated)
+        crc, isize = struct.unpack_from('<II', body, remaining - 8)
+        return body[:-8], crc, isize
 
-    def _buffered_chunk_iterator(self, chunk_size: int) -> Generator[bytes, None, None]:
+    @staticmethod
+    def _inflate_bgzf_blocks(blocks: list) -> bytes:
+        out = []
+        for cdata, crc, isize in blocks:
+            data = zlib.decompress(cdata, -15, max(isize, 1))
+            if len(data) != isize or zlib.crc32(data) != crc:
+                raise gzip.BadGzipFile("BGZF block failed CRC/size check")
+            out.append(data)
+        return b"".join(out)
+
+    def _bgzf_chunk_iterator(self, file_obj: IO[bytes], chunk_size: int) -> Generator[bytes, None, None]:
+        # BGZF blocks are independent deflate streams (<= 64 KiB each), so batches of them
+        # inflate in parallel; zlib releases the GIL. Futures are consumed in submission order.
+        # Decompressed batches in flight are bounded by chunk_size, not by the core count.
+        batch_size = min(chunk_size, 4 * 1024 * 1024)
+        max_pending = max(1, chunk_size // batch_size)
+        if hasattr(os, 'sched_getaffinity'):
+            cpus = len(os.sched_getaffinity(0))
+        else:
+            cpus = os.cpu_count() or 1
+        workers = min(cpus, max_pending)
+        pending: deque = deque()
+        eof = False
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                while not eof or pending:
+                    while not eof and len(pending) < max_pending:
+                        batch = []
+                        batch_bytes = 0
+                        while batch_bytes < batch_size:
+                            block = self._read_bgzf_block(file_obj)
+                            if block is None:
+                                eof = True
+                                break
+                            batch.append(block)
+                            batch_bytes += block[2]
+                        if batch:
+                            pending.append(pool.submit(self._inflate_bgzf_blocks, batch))
+                    if pending:
+                        yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _buffered_chunk_iterator(self, chunk_size: int) -> Generator[memoryview, None, None]:
         self._ensure_file_open()
         queue_size = 8
-        chunk_queue: "Queue[Optional[bytes]]" = Queue(maxsize=queue_size)
+        if self._fd is not None:
+            file_size = self._get_file_size()
+            if file_size:
+                chunk_size = min(chunk_size, file_size + 1)
+                queue_size = min(queue_size, file_size // chunk_size + 1)
+            readinto = io.FileIO(self._fd, 'rb', closefd=False).readinto
+        else:
+            file_obj = self.file_obj
+            chunk_size = self.read_size or chunk_size
+            if hasattr(file_obj, 'readinto1'):
+                # Pipes/sockets: hand off whatever one OS read returned instead of blocking until
+                # a whole chunk has trickled in; a big target buffer makes that one read large.
+                readinto = file_obj.readinto1  # type: ignore[union-attr]
+            elif hasattr(file_obj, 'readinto'):
+                readinto = file_obj.readinto  # type: ignore[union-attr]
+            else:
+                def readinto(buf: bytearray) -> int:
+                    data = file_obj.read(len(buf))  # type: ignore[union-attr]
+                    if not data:
+                        return 0
+                    buf[:len(data)] = data
+                    return len(data)
+
+        # The fd must not be closed (and possibly reused) while the reader is still on it;
+        # a caller's stream may block indefinitely, so that one is not waited for.
+        yield from self._prefetch_chunk_iterator(
+            readinto, chunk_size, queue_size, wait_for_reader=self._fd is not None
+        )
+
+    def _prefetch_chunk_iterator(
+        self,
+        readinto: Callable[[bytearray], Optional[int]],
+        chunk_size: int,
+        queue_size: int = 8,
+        wait_for_reader: bool = False
+    ) -> Generator[memoryview, None, None]:
+        # Buffers are recycled: a chunk yielded to the consumer is only valid until it asks
+        # for the next one, at which point its buffer goes back to the reader thread.
+        bufpool: list = []
+        free_buffers: deque = deque()
+        chunk_buffer: deque = deque()
+        not_empty = threading.Event()
+        buffer_free = threading.Event()
+        stop_event = threading.Event()
+
+        # Single producer / single consumer: deque append/popleft are atomic, and each side
+        # clears its event before re-checking, so a wakeup can't be lost between check and wait.
+        def get_buffer() -> Optional[bytearray]:
+            while not free_buffers:
+                if len(bufpool) < queue_size:
+                    buf = bytearray(chunk_size)
+                    bufpool.append(buf)
+                    return buf
+                buffer_free.clear()
+                if not free_buffers and not stop_event.is_set():
+                    buffer_free.wait()
+                if stop_event.is_set():
+                    return None
+            return free_buffers.popleft()
+
+        def put(item) -> None:
+            chunk_buffer.append(item)
+            if not not_empty.is_set():
+                not_empty.set()
 
         def chunk_reader():
             try:
-                while True:
-                    chunk = self.file_obj.read(chunk_size)  # type: ignore[union-attr]
-                    if not chunk:
-                        chunk_queue.put(None)
+                while not stop_event.is_set():
+                    buf = get_buffer()
+                    if buf is None:
+                        break
+                    n = readinto(buf)
+                    if not n:
+                        put(None)
                         break
-                    chunk_queue.put(chunk)
+                    put((buf, n))
             except Exception as e:
-                chunk_queue.put(e)  # type: ignore[arg-type]
+                put(e)
 
         reader_thread = threading.Thread(target=chunk_reader, daemon=True)
         reader_thread.start()
 
-        while True:
-            chunk = chunk_queue.get()
-            if isinstance(chunk, Exception):
-                raise chunk
-            if chunk is None:
-                break
-            yield chunk
-        reader_thread.join(timeout=0.01)
+        try:
+            while True:
+                while not chunk_buffer:
+                    not_empty.clear()
+                    if not chunk_buffer:
+                        not_empty.wait()
+                item = chunk_buffer.popleft()
+                if isinstance(item, Exception):
+                    raise item
+                if item is None:
+                    break
+                buf, n = item
+                with memoryview(buf) as view:
+                    yield view[:n]
+                free_buffers.append(buf)
+                if not buffer_free.is_set():
+                    buffer_free.set()
+        finally:
+            stop_event.set()
+            buffer_free.set()
+            reader_thread.join(timeout=None if wait_for_reader else 0.01)
+
+    def _mmap_chunk_iterator(self, chunk_size: int) -> Generator[bytes, None, None]:
+        self._ensure_file_open()
+        try:
+            mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)  # type: ignore[arg-type]
+        except (OSError, ValueError):
+            # Not mappable (special file, emptied since the size check): read it instead.
+            self._mode = "buffered"
+            yield from self._buffered_chunk_iterator(chunk_size)
+            return
+        with mm:
+            for advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+                if hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    # End chunks on a newline so the splitter never has a tail to carry over.
+                    nl = mm.rfind(b'\n', start, end)
+                    if nl >= 0:
+                        end = nl + 1
+                yield mm[start:end]
+                start = end
+
+    def _uring_chunk_iterator(self, chunk_size: int) -> Generator[bytes, None, None]:
+        self._ensure_file_open()
+        fd = self._fd
+        st = os.fstat(fd)  # type: ignore[arg-type]
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # FIFOs, devices and size-less /proc files can't be read at offsets: the top-up
+            # preadv fails and queued reads may never complete. Read them sequentially.
+            self._mode = "buffered"
+            yield from self._buffered_chunk_iterator(chunk_size)
+            return
+        file_size = st.st_size
+        queue_depth = 8
+        # Registered buffers are pinned up front, so don't size them past the file.
+        chunk_size = min(chunk_size, file_size + 1)
+        queue_depth = min(queue_depth, file_size // chunk_size + 1)
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        try:
+            # No IORING_SETUP_SQPOLL: a polling kernel thread per reader would burn a core each.
+            liburing.io_uring_queue_init(2 * queue_depth, ring)
+        except OSError:
+            # io_uring unavailable (old kernel, seccomp, sysctl). The file is already known to
+            # be a non-empty regular file, so map it as the no-liburing path would.
+            self._mode = "mmap"
+            yield from self._mmap_chunk_iterator(chunk_size)
+            return
+
+        buffers = [bytearray(chunk_size) for _ in range(queue_depth)]
+        iovecs = liburing.Iovec(buffers)
+        try:
+            liburing.io_uring_register_buffers(ring, iovecs)
+            fixed = True
+        except OSError:
+            fixed = False
+
+        offsets = [0] * queue_depth
+        results: dict = {}
+        order: deque = deque()
+        next_offset = 0
+        in_flight = 0
+        pending_submits = 0
+        submit_batch = max(1, queue_depth // 2)
+
+        def submit_read(slot: int) -> None:
+            nonlocal next_offset, pending_submits
+            sqe = liburing.io_uring_get_sqe(ring)
+            if fixed:
+                liburing.io_uring_prep_read_fixed(sqe, fd, buffers[slot], slot, next_offset)
+            else:
+                liburing.io_uring_prep_read(sqe, fd, buffers[slot], next_offset)
+            liburing.io_uring_sqe_set_data64(sqe, slot)
+            # Punt straight to io-wq so filesystems that read inline don't serialize on us.
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_ASYNC)
+            offsets[slot] = next_offset
+            order.append(slot)
+            next_offset += chunk_size
+            pending_submits += 1
+
+        def flush_submits() -> None:
+            nonlocal pending_submits, in_flight
+            if pending_submits:
+                liburing.io_uring_submit(ring)
+                in_flight += pending_submits
+                pending_submits = 0
+
+        def wait_completion() -> None:
+            nonlocal in_flight
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            try:
+                results[entry.user_data] = entry.res
+            except OSError as e:
+                # The binding raises negative results; hand them to whoever waits on the slot.
+                results[entry.user_data] = e
+            liburing.io_uring_cqe_seen(ring, entry)
+            in_flight -= 1
+
+        try:
+            for slot in range(queue_depth):
+                submit_read(slot)
+            flush_submits()
+
+            while True:
+                slot = order.popleft()
+                while slot not in results:
+                    flush_submits()
+                    wait_completion()
+                n = results.pop(slot)
+                if isinstance(n, Exception):
+                    raise n
+                if n == 0:
+                    break
+                buf = buffers[slot]
+                with memoryview(buf) as view:
+                    # Completions arrive out of order, but a short read must not leave a gap.
+                    while n < chunk_size:
+                        got = os.preadv(fd, [view[n:]], offsets[slot] + n)
+                        if not got:
+                            break
+                        n += got
+                    chunk = bytes(view[:n])
+                eof = n < chunk_size
+                if not eof:
+                    submit_read(slot)
+                    if pending_submits >= submit_batch:
+                        flush_submits()
+                yield chunk
+                if eof:
+                    break
+        finally:
+            while in_flight:
+                wait_completion()
+            if fixed:
+                liburing.io_uring_unregister_buffers(ring)
+            liburing.io_uring_queue_exit(ring)
+
+    def _line_runs(self, chunk_iterator: Iterable[bytes]) -> Generator[Tuple[bytes, int], None, None]:
+        # Yields (data, end) where data[:end] is a run of complete lines; at EOF the leftover
+        # unterminated line comes last as (tail, len(tail)). Chunks without a newline are only
+        # collected and joined once one arrives, so a line spanning many chunks costs
+        # O(length) instead of re-copying a growing buffer per chunk.
+        byte_buffer = b""
+        carry: list = []
+        for chunk in chunk_iterator:
+            if not chunk:
+                continue
+            self._bytes_processed += len(chunk)
+            data = byte_buffer + chunk
+            byte_buffer = b""
+            idx = data.rfind(b'\n')
+            if idx < 0:
+                carry.append(data)
+                continue
+            if carry:
+                carry.append(data)
+                idx += sum(map(len, carry)) - len(data)
+                data = b"".join(carry)
+                carry = []
+            yield data, idx
+            byte_buffer = data[idx + 1:]
+        if carry:
+            byte_buffer = b"".join(carry)
+        if byte_buffer:
+            yield byte_buffer, len(byte_buffer)
 
     def _read_lines_from_chunks(self, chunk_iterator: Iterable[bytes]) -> Generator[str, None, None]:
-        text_buffer = ""
+        # Loop-invariant lookups are bound to locals; counters are still written once per chunk
+        # so get_stats() stays current mid-iteration.
+        encoding = self.encoding
+        errors = self.errors
+        decode = self._decode
+        split_after_decode = (
+            codecs.lookup(encoding).name in _SPLIT_AFTER_DECODE_CODECS
+            and errors in _SPLIT_AFTER_DECODE_ERRORS
+        )
+        ascii_fast = not split_after_decode and codecs.lookup(encoding).name in _ASCII_SUPERSET_CODECS
+        split_lines = _split_lines.split_lines if _split_lines is not None else None
+        for data, end in self._line_runs(chunk_iterator):
+            if split_after_decode:
+                lines = decode(data[:end]).split('\n')
+            elif ascii_fast and data.isascii():
+                # isascii() is a word-at-a-time C scan; pure ASCII can't hit the error handler.
+                lines = data[:end].decode('ascii').split('\n')
+            elif split_lines is not None:
+                lines = split_lines(data, end, decode)
+            else:
+                lines = list(map(decode, data[:end].split(b'\n')))
+            self._line_count += len(lines)
+            yield from lines
+
+    def _read_lines_from_chunks_bytes(self, chunk_iterator: Iterable[bytes]) -> Generator[bytes, None, None]:
+        for data, end in self._line_runs(chunk_iterator):
+            lines = data[:end].split(b'\n')
+            self._line_count += len(lines)
+            yield from lines
+
+    def _read_lines_from_decoded_chunks(self, chunk_iterator: Iterable[bytes]) -> Generator[str, None, None]:
+        decode = self._decoder.decode
+        codec_name = codecs.lookup(self.encoding).name
+        boms = _BOM_CODECS.get(codec_name)
+        head = b""
+        # Only the text after the last newline is carried, as a list of pieces; a chunk's
+        # lines are split on their own and the carry is joined onto the first of them.
+        carry: list = []
         for chunk in chunk_iterator:
             if not chunk:
                 continue
             self._bytes_processed += len(chunk)
-            text = chunk.decode(self.encoding, errors=self.errors)
-            text_buffer += text
-            if '\n' in text_buffer:
-                parts = text_buffer.split('\n')
-                for line in parts[:-1]:
-                    self._track_line(line)
-                    yield line
-                text_buffer = parts[-1]
-        if text_buffer:
-            self._track_line(text_buffer)
-            yield text_buffer
+            if boms is not None:
+                head += chunk
+                if len(head) < len(boms[0]):
+                    continue
+                if not head.startswith(boms):
+                    order = 'le' if sys.byteorder == 'little' else 'be'
+                    self._decoder = codecs.getincrementaldecoder(f"{codec_name}-{order}")(self.errors)
+                    decode = self._decoder.decode
+                chunk, head, boms = head, b"", None
+            text = decode(chunk, False)
+            lines = text.split('\n')
+            if len(lines) == 1:
+                if text:
+                    carry.append(text)
+                continue
+            if carry:
+                carry.append(lines[0])
+                lines[0] = "".join(carry)
+            tail = lines.pop()
+            carry = [tail] if tail else []
+            self._line_count += len(lines)
+            yield from lines
+        carry.append(decode(head, True))
+        text = "".join(carry)
+        if text:
+            self._line_count += 1
+            yield text
 
     def _ensure_file_open(self) -> None:
+        # Fallbacks between readers (uring -> mmap -> buffered) reuse the fd that is already open.
+        if self._fd is not None:
+            return
         if getattr(self, 'file_obj', None) is None:
             if not isinstance(self.file_path, str):
                 raise ValueError("file_or_path must be a path string when no file object is provided.")
-            self.file_obj = open(self.file_path, 'rb')
+            self._fd = self._open_raw(self.file_path)
+
+    def _open_raw(self, path: str) -> int:
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        if hasattr(os, 'posix_fadvise'):
+            # Advice values are not flags, so they are issued one at a time.
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+        return fd
 
     def close(self) -> None:
+        # Stop any prefetcher before its fd goes away; a closed fd number can be reused.
+        chunk_iterator = getattr(self, '_chunk_iterator', None)
+        if chunk_iterator is not None:
+            self._chunk_iterator = None
+            chunk_iterator.close()
+        if getattr(self, '_fd', None) is not None:
+            try:
+                os.close(self._fd)  # type: ignore[arg-type]
+            except OSError:
+                pass
+            self._fd = None
         if hasattr(self, 'file_obj') and self.file_obj and not getattr(self.file_obj, 'closed', True):
             try:
                 self.file_obj.close()
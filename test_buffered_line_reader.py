@@ -0,0 +1,371 @@
+import errno
+import gzip
+import io
+import os
+import struct
+import sys
+import tempfile
+import threading
+import unittest
+import zlib
+from unittest import mock
+
+import buffered_line_reader
+from buffered_line_reader import BufferedLineReader
+
+
+class _FakeCqeEntry:
+    def __init__(self, user_data, res):
+        self.user_data = user_data
+        self._res = res
+
+    @property
+    def res(self):
+        # Like the real binding, negative results are raised rather than returned.
+        if self._res < 0:
+            raise OSError(-self._res, os.strerror(-self._res))
+        return self._res
+
+
+class FakeLiburing:
+    """
+    Stand-in for the liburing binding. Completes the newest submitted read first and
+    returns at most half of each requested buffer, so slot ordering and short-read
+    top-ups are exercised without a kernel ring.
+    """
+    IOSQE_ASYNC = 1
+
+    class Ring:
+        pass
+
+    class Cqe:
+        def __init__(self):
+            self.entry = None
+
+        def __getitem__(self, index):
+            return self.entry
+
+    class Iovec:
+        def __init__(self, buffers):
+            self.buffers = buffers
+
+    def __init__(self, fail_offset=None):
+        self.fail_offset = fail_offset
+        self.prepared = []
+        self.submitted = []
+        self.out_of_order = 0
+        self.short_reads = 0
+        self.exited = False
+
+    def io_uring_queue_init(self, entries, ring):
+        pass
+
+    def io_uring_register_buffers(self, ring, iovecs):
+        pass
+
+    def io_uring_unregister_buffers(self, ring):
+        pass
+
+    def io_uring_queue_exit(self, ring):
+        self.exited = True
+
+    def io_uring_get_sqe(self, ring):
+        sqe = {}
+        self.prepared.append(sqe)
+        return sqe
+
+    def io_uring_prep_read_fixed(self, sqe, fd, buf, buf_index, offset):
+        sqe.update(fd=fd, buf=buf, offset=offset)
+
+    def io_uring_prep_read(self, sqe, fd, buf, offset):
+        sqe.update(fd=fd, buf=buf, offset=offset)
+
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe["user_data"] = data
+
+    def io_uring_sqe_set_flags(self, sqe, flags):
+        pass
+
+    def io_uring_submit(self, ring):
+        self.submitted += self.prepared
+        self.prepared = []
+
+    def io_uring_wait_cqe(self, ring, cqe):
+        sqe = self.submitted.pop()
+        if self.submitted:
+            self.out_of_order += 1
+        if sqe["offset"] == self.fail_offset:
+            res = -errno.EIO
+        else:
+            buf = sqe["buf"]
+            data = os.pread(sqe["fd"], max(1, len(buf) // 2), sqe["offset"])
+            buf[:len(data)] = data
+            res = len(data)
+            if 0 < res < len(buf):
+                self.short_reads += 1
+        cqe.entry = _FakeCqeEntry(sqe["user_data"], res)
+
+    def io_uring_cqe_seen(self, ring, entry):
+        pass
+
+
+class SpecialFileTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_empty_file(self):
+        path = os.path.join(self.tmpdir.name, "empty.txt")
+        open(path, "wb").close()
+        for binding in (None, FakeLiburing()):
+            with self.subTest(liburing=binding), \
+                    mock.patch.object(buffered_line_reader, "liburing", binding):
+                reader = BufferedLineReader(path)
+                self.assertEqual(list(reader), [])
+                self.assertEqual(reader.get_stats()["mode"], "buffered")
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "requires os.mkfifo")
+    def test_fifo_path(self):
+        path = os.path.join(self.tmpdir.name, "pipe")
+        os.mkfifo(path)
+
+        def write():
+            with open(path, "wb") as f:
+                f.write(b"first\nsecond\nthird")
+
+        for binding in (None, FakeLiburing()):
+            with self.subTest(liburing=binding), \
+                    mock.patch.object(buffered_line_reader, "liburing", binding):
+                writer = threading.Thread(target=write, daemon=True)
+                writer.start()
+                reader = BufferedLineReader(path)
+                self.assertEqual(list(reader), ["first", "second", "third"])
+                self.assertEqual(reader.get_stats()["mode"], "buffered")
+                writer.join(timeout=5)
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "requires /proc/self/fd")
+    def test_mmap_fallback_keeps_one_fd(self):
+        path = os.path.join(self.tmpdir.name, "lines.txt")
+        with open(path, "wb") as f:
+            f.write(b"a\nb\n")
+        before = len(os.listdir("/proc/self/fd"))
+        with mock.patch.object(buffered_line_reader, "liburing", None), \
+                mock.patch.object(buffered_line_reader.mmap, "mmap", side_effect=OSError):
+            reader = BufferedLineReader(path)
+            self.assertEqual(list(reader), ["a", "b"])
+        self.assertEqual(reader.get_stats()["mode"], "buffered")
+        self.assertEqual(len(os.listdir("/proc/self/fd")), before)
+
+
+@unittest.skipUnless(hasattr(os, "pread"), "requires os.pread")
+class UringTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.lines = [f"line {i} " + "x" * (i % 37) for i in range(300)]
+        self.path = os.path.join(self.tmpdir.name, "lines.txt")
+        with open(self.path, "wb") as f:
+            f.write("\n".join(self.lines).encode("utf-8"))
+
+    def read(self, binding, **kwargs):
+        with mock.patch.object(buffered_line_reader, "liburing", binding):
+            reader = BufferedLineReader(self.path, **kwargs)
+            return reader, list(reader)
+
+    def test_out_of_order_short_reads(self):
+        for chunk_size in (1, 64, 1000, None):
+            with self.subTest(chunk_size=chunk_size):
+                binding = FakeLiburing()
+                reader, lines = self.read(binding, chunk_size=chunk_size)
+                self.assertEqual(lines, self.lines)
+                self.assertEqual(reader.get_stats()["mode"], "uring")
+                self.assertTrue(binding.exited)
+                self.assertEqual(binding.submitted, [])
+                if chunk_size != 1:
+                    self.assertGreater(binding.short_reads, 0)
+                if chunk_size in (1, 64, 1000):
+                    self.assertGreater(binding.out_of_order, 0)
+
+    def test_read_error_is_raised_and_ring_drained(self):
+        binding = FakeLiburing(fail_offset=3 * 64)
+        with mock.patch.object(buffered_line_reader, "liburing", binding):
+            with self.assertRaises(OSError) as ctx:
+                list(BufferedLineReader(self.path, chunk_size=64))
+        self.assertEqual(ctx.exception.errno, errno.EIO)
+        self.assertTrue(binding.exited)
+        self.assertEqual(binding.submitted, [])
+
+    def test_ring_setup_failure_falls_back_to_mmap(self):
+        binding = FakeLiburing()
+        binding.io_uring_queue_init = mock.Mock(side_effect=OSError(errno.EPERM, "blocked"))
+        reader, lines = self.read(binding, chunk_size=64)
+        self.assertEqual(lines, self.lines)
+        self.assertEqual(reader.get_stats()["mode"], "mmap")
+
+    def test_early_close_drains_ring(self):
+        binding = FakeLiburing()
+        with mock.patch.object(buffered_line_reader, "liburing", binding):
+            with BufferedLineReader(self.path, chunk_size=64) as reader:
+                it = iter(reader)
+                self.assertEqual(next(it), self.lines[0])
+        self.assertTrue(binding.exited)
+        self.assertEqual(binding.submitted, [])
+
+
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+
+def bgzf_compress(data, block_size=1000):
+    """Minimal BGZF writer: one raw-deflate gzip member with a 'BC' size field per block."""
+    out = bytearray()
+    for start in range(0, len(data), block_size):
+        piece = data[start:start + block_size]
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        cdata = compressor.compress(piece) + compressor.flush()
+        bsize = 12 + 6 + len(cdata) + 8 - 1
+        out += b"\x1f\x8b\x08\x04" + bytes(4) + b"\x00\xff" + struct.pack("<H", 6)
+        out += b"BC" + struct.pack("<HH", 2, bsize)
+        out += cdata + struct.pack("<II", zlib.crc32(piece), len(piece))
+    return bytes(out + BGZF_EOF)
+
+
+class BgzfTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.lines = [f"record {i}\t" + "acgt" * (i % 29) for i in range(2000)]
+        self.data = "\n".join(self.lines).encode("utf-8")
+
+    def write(self, data, name):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def read(self, path, **kwargs):
+        inflate = mock.Mock(wraps=BufferedLineReader._inflate_bgzf_blocks)
+        with mock.patch.object(BufferedLineReader, "_inflate_bgzf_blocks", inflate):
+            lines = list(BufferedLineReader(path, **kwargs))
+        return lines, inflate.call_count
+
+    def test_valid(self):
+        blob = bgzf_compress(self.data)
+        self.assertEqual(gzip.decompress(blob), self.data)
+        for name in ("data.txt.gz", "data.txt.bgz"):
+            path = self.write(blob, name)
+            for chunk_size in (1000, 5000, None):
+                with self.subTest(name=name, chunk_size=chunk_size):
+                    lines, batches = self.read(path, chunk_size=chunk_size)
+                    self.assertEqual(lines, self.lines)
+                    self.assertGreater(batches, 0)
+
+    def test_bgz_holding_plain_gzip(self):
+        path = self.write(gzip.compress(self.data), "data.txt.bgz")
+        lines, batches = self.read(path)
+        self.assertEqual(lines, self.lines)
+        self.assertEqual(batches, 0)
+
+    def test_corrupt_crc(self):
+        blob = bytearray(bgzf_compress(self.data))
+        first_block_end = struct.unpack_from("<H", blob, 16)[0] + 1
+        blob[first_block_end - 8] ^= 0xFF
+        path = self.write(bytes(blob), "data.txt.bgz")
+        with self.assertRaises(gzip.BadGzipFile):
+            list(BufferedLineReader(path))
+
+    def test_truncated(self):
+        blob = bgzf_compress(self.data)
+        first_block_end = struct.unpack_from("<H", blob, 16)[0] + 1
+        for cut in (first_block_end + 5, first_block_end + 14, len(blob) // 2):
+            with self.subTest(cut=cut):
+                path = self.write(blob[:cut], "data.txt.bgz")
+                with self.assertRaises(EOFError):
+                    list(BufferedLineReader(path))
+
+
+class _ReadOnlyStream:
+    """File-like object with read() only, no readinto/readinto1."""
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+class StreamTests(unittest.TestCase):
+    def test_read_size_for_each_read_method(self):
+        data = b"alpha\nbeta\n\ngamma"
+        streams = {
+            "readinto1": lambda: io.BufferedReader(io.BytesIO(data)),
+            "readinto": lambda: io.BytesIO(data),
+            "read": lambda: _ReadOnlyStream(data),
+        }
+        for name, make in streams.items():
+            for read_size in (1, 4, None):
+                with self.subTest(stream=name, read_size=read_size):
+                    reader = BufferedLineReader(make(), read_size=read_size)
+                    self.assertEqual(list(reader), ["alpha", "beta", "", "gamma"])
+                    self.assertEqual(reader.get_stats()["mode"], "buffered")
+
+
+class EncodingTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, data, name="data.txt"):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_multibyte_characters_split_across_chunks(self):
+        lines = ["h\u00e9llo", "\u65e5\u672c\u8a9e", "", "\U0001f600x"]
+        path = self.write("\n".join(lines).encode("utf-8"))
+        for chunk_size in (1, 2, 3, 5):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(BufferedLineReader(path, chunk_size=chunk_size)), lines)
+
+    def test_wide_encodings(self):
+        lines = ["h\u00e9llo", "", "\U0001f600\u65e5"]
+        for encoding in ("utf-16", "utf-16-be", "utf-32", "utf-8-sig"):
+            path = self.write("\n".join(lines).encode(encoding))
+            for chunk_size in (1, 3, None):
+                with self.subTest(encoding=encoding, chunk_size=chunk_size):
+                    reader = BufferedLineReader(path, chunk_size=chunk_size, encoding=encoding)
+                    self.assertEqual(list(reader), lines)
+
+    def test_single_byte_codecs(self):
+        # 0x98 is unmapped in cp1251, so the error handler runs on some lines.
+        data = "\u041f\u0440\u0438\u0432\u0435\u0442\nabc\n".encode("cp1251") * 50 + b"x\x98y\n\x98\n"
+        for encoding in ("cp1251", "koi8-r", "cp437", "iso8859-5"):
+            for errors in ("strict", "replace", "ignore", "backslashreplace"):
+                try:
+                    expected = data.decode(encoding, errors).split("\n")[:-1]
+                except UnicodeDecodeError:
+                    continue
+                path = self.write(data)
+                for chunk_size in (7, None):
+                    with self.subTest(encoding=encoding, errors=errors, chunk_size=chunk_size):
+                        reader = BufferedLineReader(path, chunk_size=chunk_size, encoding=encoding, errors=errors)
+                        self.assertEqual(list(reader), expected)
+
+    def test_bom_less_wide_encodings_use_native_order(self):
+        text = "h\u00e9llo\nw\u00f6rld\n"
+        for encoding in ("utf-16", "utf-32"):
+            order = "le" if sys.byteorder == "little" else "be"
+            path = self.write(text.encode(f"{encoding}-{order}"))
+            for chunk_size in (1, 3, None):
+                with self.subTest(encoding=encoding, chunk_size=chunk_size):
+                    reader = BufferedLineReader(path, chunk_size=chunk_size, encoding=encoding)
+                    self.assertEqual(list(reader), ["h\u00e9llo", "w\u00f6rld"])
+
+    def test_odd_length_utf16_is_replaced(self):
+        path = self.write("ab\n".encode("utf-16-le") + b"x")
+        reader = BufferedLineReader(path, encoding="utf-16", errors="replace")
+        self.assertEqual(list(reader), ["ab", "\ufffd"])
+
+
+if __name__ == "__main__":
+    unittest.main()